@@ -0,0 +1,546 @@
+# Thermal_Plots.py
+#
+# Generates temperature plots from Thermal Desktop simulation data.
+# Reads the simulation CSV (header row: "Time, min", then one column per
+# component node) and the component limits CSV, then produces a timestamped
+# results folder containing consolidated per-deck plots, zoomed consolidated
+# plots, full profile plots and last-2-orbit plots for each component, plus
+# a text report comparing simulation temperatures against design and
+# acceptance limits.
+
+import os
+import configparser
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # non-interactive, safe to use from worker processes
+import matplotlib.pyplot as plt
+from scipy.interpolate import PchipInterpolator
+
+# Cheaper Agg path handling for the 5000-point interpolated lines.
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# Numba is optional; without it the script falls back to SciPy's
+# PchipInterpolator for the interpolation step. The workqueue threading
+# layer is the only one that stays fork-safe, which matters because the
+# individual-plot workers are forked after the interpolation has run.
+os.environ.setdefault('NUMBA_THREADING_LAYER', 'workqueue')
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _pchip_edge(h0, h1, d0, d1):
+        # Shape-preserving one-sided endpoint tangent (same formula SciPy
+        # uses in PchipInterpolator._edge_case).
+        m = ((2.0 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+        if m * d0 <= 0.0:
+            m = 0.0
+        elif d0 * d1 < 0.0 and abs(m) > 3.0 * abs(d0):
+            m = 3.0 * d0
+        return m
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def pchip_matrix(t, Y, tq):
+        """PCHIP-interpolate every column of Y (sampled at t) onto tq.
+
+        Computes the Fritsch-Carlson tangents once per column and evaluates
+        the cubic Hermite basis for all query points, with the columns
+        spread across threads. Equivalent to
+        PchipInterpolator(t, Y, axis=0)(tq) for in-range tq.
+        """
+        n = t.shape[0]
+        num_components = Y.shape[1]
+        nq = tq.shape[0]
+        h = t[1:] - t[:-1]
+
+        # Interval index of every query point, computed once for all
+        # components since they share the same time axis.
+        idx = np.searchsorted(t, tq, side='right') - 1
+        for k in range(nq):
+            if idx[k] < 0:
+                idx[k] = 0
+            elif idx[k] > n - 2:
+                idx[k] = n - 2
+
+        out = np.empty((nq, num_components))
+        for j in prange(num_components):
+            y = Y[:, j]
+            d = np.empty(n - 1)
+            for i in range(n - 1):
+                d[i] = (y[i + 1] - y[i]) / h[i]
+
+            m = np.empty(n)
+            if n == 2:
+                m[0] = d[0]
+                m[1] = d[0]
+            else:
+                # Fritsch-Carlson: weighted harmonic mean of the two
+                # neighbouring secant slopes, zero at local extrema.
+                for i in range(1, n - 1):
+                    if d[i - 1] == 0.0 or d[i] == 0.0 or d[i - 1] * d[i] < 0.0:
+                        m[i] = 0.0
+                    else:
+                        w1 = 2.0 * h[i] + h[i - 1]
+                        w2 = h[i] + 2.0 * h[i - 1]
+                        m[i] = (w1 + w2) / (w1 / d[i - 1] + w2 / d[i])
+                m[0] = _pchip_edge(h[0], h[1], d[0], d[1])
+                m[n - 1] = _pchip_edge(h[n - 2], h[n - 3], d[n - 2], d[n - 3])
+
+            for k in range(nq):
+                i = idx[k]
+                s = (tq[k] - t[i]) / h[i]
+                s2 = s * s
+                s3 = s2 * s
+                h00 = 2.0 * s3 - 3.0 * s2 + 1.0
+                h10 = s3 - 2.0 * s2 + s
+                h01 = -2.0 * s3 + 3.0 * s2
+                h11 = s3 - s2
+                out[k, j] = (h00 * y[i] + h10 * h[i] * m[i]
+                             + h01 * y[i + 1] + h11 * h[i] * m[i + 1])
+        return out
+
+    @njit(cache=True, parallel=True)
+    def interp_linear_matrix(t, Y, tq):
+        """Linearly interpolate every column of Y (sampled at t) onto tq."""
+        out = np.empty((tq.shape[0], Y.shape[1]))
+        for j in prange(Y.shape[1]):
+            out[:, j] = np.interp(tq, t, Y[:, j])
+        return out
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+config = configparser.ConfigParser()
+config.read('config.ini')
+
+# Snapshot the INI into plain dicts once: every configparser get* does an
+# interpolation-aware, case-insensitive lookup plus conversion, and the
+# plain dicts also pickle cleanly for the plot worker processes.
+raw_config = {section: dict(config.items(section)) for section in config.sections()}
+files_cfg = raw_config['FILES']
+settings_cfg = raw_config['SETTINGS']
+ranges_cfg = raw_config['PLOT_RANGES']
+styles_cfg = raw_config['COLORS_AND_STYLES']
+fonts_cfg = raw_config['FONTS']
+
+simulation_data_filename = files_cfg['simulation_data_filename']
+limits_filename = files_cfg['limits_filename']
+output_directory = files_cfg['output_directory']
+
+generate_individual_plots = settings_cfg['generate_individual_plots'].strip().lower() in (
+    '1', 'yes', 'true', 'on')
+number_of_interpolation_points = int(settings_cfg['number_of_interpolation_points'])
+orbit_period_minutes = float(settings_cfg['orbit_period_minutes'])
+last_orbit_count = int(settings_cfg['last_orbit_count'])
+x_tick_step = int(settings_cfg['x_tick_step'])
+y_tick_step = int(settings_cfg['y_tick_step'])
+plot_dpi = int(settings_cfg.get('plot_dpi', 200))
+interp_method = settings_cfg.get('interp_method', 'pchip').lower()
+
+zoom_plot_x_start = float(ranges_cfg['zoom_plot_x_start'])
+temperature_margin = float(ranges_cfg['temperature_margin'])
+
+line_thickness = float(styles_cfg['line_thickness'])
+individual_plot_color = styles_cfg['individual_plot_color']
+grid_line_style = styles_cfg['grid_line_style']
+grid_line_width = float(styles_cfg['grid_line_width'])
+spine_color = styles_cfg['spine_color']
+spine_line_width = float(styles_cfg['spine_line_width'])
+color_cycle = [c.strip() for c in styles_cfg['color_cycle'].split(',')]
+
+font_family = fonts_cfg['font_family']
+title_fontsize = int(fonts_cfg['title_fontsize'])
+label_fontsize = int(fonts_cfg['label_fontsize'])
+full_plot_axis_fontsize = int(fonts_cfg['full_plot_axis_fontsize'])
+legend_fontsize = int(fonts_cfg['legend_fontsize'])
+
+excluded_components = [c.strip() for c in
+                       raw_config['EXCLUDED']['excluded_components'].split(',') if c.strip()]
+
+# Configure fonts once through rcParams so every axis inherits them;
+# resolving fonts per label via plt.setp/font kwargs re-triggers the font
+# manager lookup for every tick of every plot.
+plt.rcParams.update({'axes.edgecolor': spine_color,
+                     'axes.linewidth': spine_line_width,
+                     'font.family': font_family,
+                     'font.weight': 'bold',
+                     'axes.titleweight': 'bold',
+                     'axes.titlesize': title_fontsize,
+                     'axes.labelweight': 'bold',
+                     'axes.labelsize': label_fontsize,
+                     'xtick.labelsize': full_plot_axis_fontsize,
+                     'ytick.labelsize': full_plot_axis_fontsize})
+
+# ---------------------------------------------------------------------------
+# Load the simulation data and component limits
+# ---------------------------------------------------------------------------
+
+# The limits file is tiny and always read fresh. The pyarrow engine parses
+# wide CSVs with many float columns in parallel and is several times faster
+# than the default C engine; fall back to the default engine when pyarrow
+# is not installed.
+try:
+    limits_df = pd.read_csv(limits_filename, engine='pyarrow')
+except ImportError:
+    limits_df = pd.read_csv(limits_filename)
+
+# Limits keyed by display name: one dict lookup per report row instead of
+# filtering the limits frame per component.
+limits_map = {rec[0]: rec[1:] for rec in
+              limits_df[['Component', 'Design Min', 'Design Max',
+                         'Acceptance Min', 'Acceptance Max']].itertuples(index=False)}
+
+# Repeated runs over the same simulation file (the usual case while
+# iterating on plot styling) skip the CSV parse and interpolation entirely:
+# the numeric results are cached in an .npz keyed by the file's mtime and
+# size plus everything else that changes the matrices.
+cache_tag = hashlib.md5(('%d_%d_%d_%s_%s'
+                         % (int(os.path.getmtime(simulation_data_filename)),
+                            os.path.getsize(simulation_data_filename),
+                            number_of_interpolation_points,
+                            interp_method,
+                            ','.join(sorted(excluded_components)))).encode()).hexdigest()
+cache_path = os.path.join('cache', 'simulation_%s.npz' % cache_tag)
+
+if os.path.exists(cache_path):
+    cached = np.load(cache_path, allow_pickle=False)
+    time_orig = cached['time_orig']
+    data_matrix = cached['data_matrix']
+    interp_all = cached['interp_all']
+    all_component_names = [str(name) for name in cached['columns']]
+else:
+    try:
+        data_df = pd.read_csv(simulation_data_filename, engine='pyarrow')
+    except ImportError:
+        data_df = pd.read_csv(simulation_data_filename)
+
+    data_df = data_df.dropna(how='all')
+
+    all_component_names = [c for c in data_df.columns
+                           if c != 'Time, min' and c not in excluded_components]
+
+    # One global preprocessing pass: sort by time, coerce every component
+    # column to float and interpolate everything onto a common fine time
+    # grid in one call. All components share the same "Time, min" axis, so
+    # a single interpolation over the (num_samples x num_components) matrix
+    # replaces one pchip_interpolate call per component, and downstream
+    # code works on plain NumPy slices instead of per-component DataFrames.
+    data_df.sort_values('Time, min', inplace=True, kind='mergesort')
+
+    time_orig = pd.to_numeric(data_df['Time, min'], errors='coerce').to_numpy(dtype=np.float64)
+    data_matrix = data_df[all_component_names].apply(pd.to_numeric, errors='coerce') \
+                                              .to_numpy(dtype=np.float64)
+
+    valid_rows = ~np.isnan(time_orig) & ~np.isnan(data_matrix).all(axis=1)
+    time_orig = time_orig[valid_rows]
+    data_matrix = data_matrix[valid_rows]
+
+    # PCHIP cannot handle missing samples, so fill isolated gaps from the
+    # neighbouring rows before interpolating. Raw (unfilled) values are
+    # kept in data_matrix for the min/max comparisons in the report.
+    filled_matrix = pd.DataFrame(data_matrix).ffill().bfill().to_numpy(dtype=np.float64)
+
+    time_fine_query = np.linspace(time_orig[0], time_orig[-1], number_of_interpolation_points)
+    if interp_method == 'linear':
+        # Linear is ~10x cheaper than PCHIP and visually identical on
+        # densely sampled runs; handy while iterating on plot styling.
+        if NUMBA_AVAILABLE:
+            interp_all = interp_linear_matrix(time_orig, filled_matrix, time_fine_query)
+        else:
+            interp_all = np.column_stack(
+                [np.interp(time_fine_query, time_orig, filled_matrix[:, j])
+                 for j in range(filled_matrix.shape[1])])
+    elif NUMBA_AVAILABLE:
+        interp_all = pchip_matrix(time_orig, filled_matrix, time_fine_query)
+    else:
+        interp_all = PchipInterpolator(time_orig, filled_matrix, axis=0,
+                                       extrapolate=False)(time_fine_query)
+
+    os.makedirs('cache', exist_ok=True)
+    np.savez(cache_path, time_orig=time_orig, data_matrix=data_matrix,
+             interp_all=interp_all, columns=np.array(all_component_names))
+
+time_fine = np.linspace(time_orig[0], time_orig[-1], number_of_interpolation_points)
+col_idx = {name: i for i, name in enumerate(all_component_names)}
+
+# Group the components by deck. Column headers look like "DECK_Component.T1";
+# everything before ".T" is the display name and the part before the first
+# underscore is the deck the component sits on. The splits run vectorized in
+# pandas and the resulting maps make every downstream name lookup O(1).
+names = pd.Series(all_component_names)
+display_names = names.str.split('.T', n=1, regex=False).str[0]
+deck_prefixes = display_names.str.split('_', n=1).str[0]
+deck_groups = {deck: list(group) for deck, group in names.groupby(deck_prefixes.values)}
+display_map = dict(zip(names, display_names))
+
+last_orbit_x_start = time_orig[-1] - last_orbit_count * orbit_period_minutes
+
+# time_fine is uniformly spaced, so the start index of each plot window
+# follows in closed form instead of an np.where scan per deck. A window
+# that lies outside the simulated range falls back to the full profile
+# instead of producing empty slices downstream.
+dt_fine = (time_fine[-1] - time_fine[0]) / (number_of_interpolation_points - 1)
+zoom_start_index_fine = max(0, int(np.ceil((zoom_plot_x_start - time_fine[0]) / dt_fine)))
+if zoom_start_index_fine > number_of_interpolation_points - 1:
+    print('Warning: zoom_plot_x_start = %g is beyond the simulated range; '
+          'zoomed plots will show the full profile.' % zoom_plot_x_start)
+    zoom_start_index_fine = 0
+    zoom_plot_x_start = time_fine[0]
+if last_orbit_x_start < time_fine[0]:
+    print('Warning: the simulation is shorter than the last %d orbits; '
+          'last-orbit plots will show the full profile.' % last_orbit_count)
+    last_orbit_x_start = time_fine[0]
+last_orbit_start_index_fine = min(number_of_interpolation_points - 1,
+                                  max(0, int(np.ceil((last_orbit_x_start - time_fine[0])
+                                                     / dt_fine))))
+
+# ---------------------------------------------------------------------------
+# Output folders
+# ---------------------------------------------------------------------------
+
+timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+run_directory = os.path.join(output_directory, 'Thermal_Plots_' + timestamp)
+consolidated_dir = os.path.join(run_directory, 'All Component Consolidated Plots')
+zoomed_consolidated_dir = os.path.join(run_directory, 'Zoomed Consolidated Plots')
+full_profile_dir = os.path.join(run_directory, 'Full Profile Plots')
+last_orbit_dir = os.path.join(run_directory, 'Last 2 Orbit Plots')
+for directory in (consolidated_dir, zoomed_consolidated_dir, full_profile_dir, last_orbit_dir):
+    os.makedirs(directory, exist_ok=True)
+
+report_filepath = os.path.join(run_directory, 'Component_Temperature_Report.txt')
+
+# ---------------------------------------------------------------------------
+# Individual component plots (full profile + last 2 orbits)
+# ---------------------------------------------------------------------------
+
+def ticks(x0, x1, step):
+    """Sorted integer tick positions from x0 to x1 inclusive, step apart."""
+    a = np.arange(int(np.floor(x0 / step)) * step, int(x1) + 1, step, dtype=np.int64)
+    if a[-1] != int(x1):
+        a = np.concatenate([a, [int(x1)]])
+    return a
+
+
+# One reusable figure per plot type per process; clearing the axes between
+# components keeps the font manager and canvas warm instead of rebuilding
+# the whole Matplotlib artist graph for every component.
+_fig_full = _ax_full = None
+_fig_last_orbit = _ax_last_orbit = None
+
+
+def render_component(work_item):
+    """Render the full-profile and last-2-orbit plots for one component.
+
+    Runs in a worker process; everything it needs arrives as plain NumPy
+    arrays and floats so nothing pandas-shaped crosses the process boundary
+    (plot styling and output paths come in as inherited module globals).
+    """
+    global _fig_full, _ax_full, _fig_last_orbit, _ax_last_orbit
+    if _fig_full is None:
+        _fig_full, _ax_full = plt.subplots(figsize=(12, 6), layout='constrained')
+        _fig_last_orbit, _ax_last_orbit = plt.subplots(figsize=(12, 6), layout='constrained')
+        # Keep the rasterized data lines in a single raster layer on vector
+        # backends; text and ticks stay vector-crisp.
+        _ax_full.set_rasterization_zorder(1)
+        _ax_last_orbit.set_rasterization_zorder(1)
+
+    display_name, component_data_interp, raw_min, raw_max = work_item
+
+    # Full profile plot. The limits are known up front, so they are set
+    # with autoscale disabled before plotting and Matplotlib skips the
+    # data-limit pass it would otherwise run per line.
+    fig, ax = _fig_full, _ax_full
+    ax.clear()
+    ax.set_autoscale_on(False)
+    ax.set_xlim(time_fine[0], time_fine[-1])
+    ax.set_ylim(raw_min - temperature_margin, raw_max + temperature_margin)
+    ax.plot(time_fine, component_data_interp,
+            linewidth=line_thickness, color=individual_plot_color, rasterized=True)
+    ax.set_title(display_name + ' - Full Temperature Profile')
+    ax.set_xlabel('Time, min')
+    ax.set_ylabel('Temperature, \N{DEGREE SIGN}C')
+    ax.grid(True, linestyle=grid_line_style, linewidth=grid_line_width)
+    ax.set_xticks(ticks(time_fine[0], time_fine[-1], x_tick_step))
+    fig.savefig(os.path.join(full_profile_dir, display_name + '.png'),
+                dpi=plot_dpi, pil_kwargs={'compress_level': 1})
+
+    # Last 2 orbits plot. Slicing from the precomputed window index is a
+    # zero-copy view, unlike a boolean mask.
+    fig, ax = _fig_last_orbit, _ax_last_orbit
+    ax.clear()
+    y_window = component_data_interp[last_orbit_start_index_fine:]
+    ax.set_autoscale_on(False)
+    ax.set_xlim(last_orbit_x_start, time_fine[-1])
+    ax.set_ylim(y_window.min() - temperature_margin, y_window.max() + temperature_margin)
+    ax.plot(time_fine[last_orbit_start_index_fine:], y_window,
+            linewidth=line_thickness, color=individual_plot_color, rasterized=True)
+    ax.set_title(display_name + ' - Last %d Orbits' % last_orbit_count)
+    ax.set_xlabel('Time, min')
+    ax.set_ylabel('Temperature, \N{DEGREE SIGN}C')
+    ax.grid(True, linestyle=grid_line_style, linewidth=grid_line_width)
+    fig.savefig(os.path.join(last_orbit_dir, display_name + '.png'),
+                dpi=plot_dpi, pil_kwargs={'compress_level': 1})
+
+
+if generate_individual_plots:
+    work_items = []
+    for component_name in all_component_names:
+        col = data_matrix[:, col_idx[component_name]]
+        raw_mask = ~np.isnan(col)
+        work_items.append((display_map[component_name],
+                           interp_all[:, col_idx[component_name]],
+                           col[raw_mask].min(), col[raw_mask].max()))
+    # PNG rasterization/encoding is CPU-bound, so fan the components out
+    # across one worker per core. The workers rely on fork inheriting the
+    # module globals (config values, time_fine, output paths); on platforms
+    # without fork, render serially instead.
+    if 'fork' in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 mp_context=multiprocessing.get_context('fork')) as executor:
+            list(executor.map(render_component, work_items, chunksize=8))
+    else:
+        for work_item in work_items:
+            render_component(work_item)
+
+# ---------------------------------------------------------------------------
+# Consolidated per-deck plots and the temperature report
+# ---------------------------------------------------------------------------
+
+report_file = open(report_filepath, 'w', buffering=1 << 20)
+report_header = ('Component Temperature Report - generated %s\n' % timestamp
+                 + '=' * 110 + '\n'
+                 + '%-30s %10s %10s %12s %12s %12s %12s %8s\n'
+                 % ('Component', 'Sim Min', 'Sim Max', 'Design Min', 'Design Max',
+                    'Accept Min', 'Accept Max', 'Result')
+                 + '-' * 110 + '\n')
+report_file.write(report_header)
+
+# The three consolidated figures are reused across decks; clearing the axes
+# is much cheaper than rebuilding 16x9 figures per deck.
+fig_deck, ax_deck = plt.subplots(figsize=(16, 9), layout='constrained')
+fig_deck_zoomed, ax_deck_zoomed = plt.subplots(figsize=(16, 9), layout='constrained')
+fig_deck_last_orbit, ax_deck_last_orbit = plt.subplots(figsize=(16, 9), layout='constrained')
+for deck_axis in (ax_deck, ax_deck_zoomed, ax_deck_last_orbit):
+    deck_axis.set_rasterization_zorder(1)
+
+for deck_name, component_list in deck_groups.items():
+    ax_deck.clear()
+    ax_deck_zoomed.clear()
+    ax_deck_last_orbit.clear()
+
+    # All of this deck's interpolated curves as one (time, component) matrix
+    # pulled straight out of the global interp result.
+    deck_col_indices = np.array([col_idx[c] for c in component_list], dtype=np.int32)
+    deck_matrix = interp_all[:, deck_col_indices]
+
+    deck_labels = [display_map[c] for c in component_list]
+    deck_colors = [color_cycle[i % len(color_cycle)] for i in range(len(component_list))]
+
+    # One plot call per axis creates every Line2D in a single pass instead
+    # of one Python-level call per component per axis. The zoom and
+    # last-orbit windows are plain slices from the precomputed start
+    # indices, so no boolean mask arrays get allocated. Axis limits are all
+    # set explicitly below, so autoscale is off and plotting skips the
+    # data-limit pass per line.
+    ax_deck.set_autoscale_on(False)
+    ax_deck_zoomed.set_autoscale_on(False)
+    ax_deck_last_orbit.set_autoscale_on(False)
+    deck_lines = ax_deck.plot(time_fine, deck_matrix, linewidth=line_thickness,
+                              rasterized=True)
+    zoomed_lines = ax_deck_zoomed.plot(time_fine[zoom_start_index_fine:],
+                                       deck_matrix[zoom_start_index_fine:, :],
+                                       linewidth=line_thickness, rasterized=True)
+    last_orbit_lines = ax_deck_last_orbit.plot(time_fine[last_orbit_start_index_fine:],
+                                               deck_matrix[last_orbit_start_index_fine:, :],
+                                               linewidth=line_thickness, rasterized=True)
+    for line_set in (deck_lines, zoomed_lines, last_orbit_lines):
+        for line, label, color in zip(line_set, deck_labels, deck_colors):
+            line.set_label(label)
+            line.set_color(color)
+
+    report_lines = []
+    for component_name in component_list:
+        col = data_matrix[:, col_idx[component_name]]
+        raw_mask = ~np.isnan(col)
+        raw_min = col[raw_mask].min()
+        raw_max = col[raw_mask].max()
+        display_name = display_map[component_name]
+
+        # Compare the simulated extremes against the component limits.
+        limits = limits_map.get(display_name)
+        if limits is not None:
+            design_min, design_max, accept_min, accept_max = limits
+            result = 'PASS' if raw_min >= accept_min and raw_max <= accept_max else 'FAIL'
+            report_lines.append(
+                f'{display_name:<30} {raw_min:10.2f} {raw_max:10.2f} '
+                f'{design_min:12.2f} {design_max:12.2f} '
+                f'{accept_min:12.2f} {accept_max:12.2f} {result:>8}\n')
+        else:
+            report_lines.append(f'{display_name:<30} {raw_min:10.2f} {raw_max:10.2f} '
+                                f"{'NO LIMITS FOUND':>51}\n")
+    report_file.write(''.join(report_lines))
+
+    # Shared y-limits for the zoomed and last-orbit deck plots, answered
+    # from per-time-point extrema computed once per deck. Only the suffix
+    # from the earliest window start ever feeds a y-limit, so the scan
+    # skips the head of the matrix entirely.
+    stats_start = min(zoom_start_index_fine, last_orbit_start_index_fine)
+    col_min = deck_matrix[stats_start:].min(axis=1)
+    col_max = deck_matrix[stats_start:].max(axis=1)
+    # initial= keeps the head reduction safe when stats_start == 0 and the
+    # windows already cover the whole profile.
+    deck_full_min = min(deck_matrix[:stats_start].min(initial=np.inf), col_min.min())
+    deck_full_max = max(deck_matrix[:stats_start].max(initial=-np.inf), col_max.max())
+    deck_zoomed_min = col_min[zoom_start_index_fine - stats_start:].min()
+    deck_zoomed_max = col_max[zoom_start_index_fine - stats_start:].max()
+    deck_last_orbit_min = col_min[last_orbit_start_index_fine - stats_start:].min()
+    deck_last_orbit_max = col_max[last_orbit_start_index_fine - stats_start:].max()
+
+    for ax, title, x0, x1, y0, y1 in (
+            (ax_deck, deck_name + ' Deck - Full Temperature Profile',
+             time_fine[0], time_fine[-1],
+             deck_full_min - temperature_margin, deck_full_max + temperature_margin),
+            (ax_deck_zoomed, deck_name + ' Deck - Zoomed Temperature Profile',
+             zoom_plot_x_start, time_fine[-1],
+             deck_zoomed_min - temperature_margin, deck_zoomed_max + temperature_margin),
+            (ax_deck_last_orbit, deck_name + ' Deck - Last %d Orbits' % last_orbit_count,
+             last_orbit_x_start, time_fine[-1],
+             deck_last_orbit_min - temperature_margin,
+             deck_last_orbit_max + temperature_margin)):
+        ax.set_title(title)
+        ax.set_xlabel('Time, min')
+        ax.set_ylabel('Temperature, \N{DEGREE SIGN}C')
+        ax.grid(True, linestyle=grid_line_style, linewidth=grid_line_width)
+        ax.set_xlim(x0, x1)
+        ax.set_ylim(y0, y1)
+        ax.set_yticks(ticks(y0, y1, y_tick_step))
+        ax.legend(loc='upper right', fontsize=legend_fontsize)
+
+    fig_deck.savefig(os.path.join(consolidated_dir, deck_name + '_consolidated.png'),
+                     dpi=plot_dpi, pil_kwargs={'compress_level': 1})
+    fig_deck_zoomed.savefig(os.path.join(zoomed_consolidated_dir,
+                                         deck_name + '_zoomed_consolidated.png'),
+                            dpi=plot_dpi, pil_kwargs={'compress_level': 1})
+    fig_deck_last_orbit.savefig(os.path.join(last_orbit_dir,
+                                             deck_name + '_last_%d_orbits.png' % last_orbit_count),
+                                dpi=plot_dpi,
+                                pil_kwargs={'compress_level': 1})
+
+plt.close(fig_deck)
+plt.close(fig_deck_zoomed)
+plt.close(fig_deck_last_orbit)
+report_file.close()
+print('Done. Results written to ' + run_directory)